@@ -1,15 +1,26 @@
-import json
+import asyncio
+import hashlib
+import logging
 import re
+import threading
 import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable
 
 import httpx
+import orjson
 import pandas as pd
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 import trafilatura
 
-from llm_openai import rewrite_description
+from llm_openai import LLMSession, llm_session, rewrite_description_async, submit_batch, wait_for_batch
 from error_logging import (
+    Results,
     ensure_error_columns,
+    init_results,
+    apply_results,
     normalize_url,
     domain_of,
     safe_str,
@@ -20,62 +31,104 @@ from error_logging import (
 )
 
 # ---------------------------------------------------------------------
-# Logging strategy (planned improvement)
+# Logging strategy
 #
-# TODO (Next step):
-#   Replace ad-hoc print statements with Python's built-in `logging` module.
-#
-# Proposed logging design:
-#   - Configure logging once at application startup (entry-point).
-#   - Use structured, level-based logs:
+#   - Logging is configured once at application startup (streamlit_app.py).
+#   - Level-based logs with lazy %-formatting:
 #       * INFO    : high-level pipeline progress (start/end of processing)
-#       * WARNING : non-fatal issues (e.g., partial content extraction)
-#       * ERROR   : external service failures (LLM errors, request failures)
-#   - Use a consistent log format to support aggregation and monitoring in production.
-#
-# Rationale:
-#   This enables observability in production environments and avoids relying
-#   on stdout prints for troubleshooting.
+#       * WARNING : non-fatal issues (e.g., LLM errors -> scraper fallback)
+#   - A consistent log format supports aggregation and monitoring in production.
 # ---------------------------------------------------------------------
 
+logger = logging.getLogger(__name__)
+
 TIMEOUT_S = 20
 PER_DOMAIN_DELAY_S = 0.8
 MAX_TEXT = 6000
 
+# Max HTML bytes read per page (description metadata lives near the top of the document)
+MAX_HTML_BYTES = 512 * 1024
+
 # How much text to send to the LLM (keeps cost/time bounded)
 LLM_CONTEXT_CHARS = 2500
 
 UA = "Mozilla/5.0 (compatible; SSCTechCompanyEnricher/1.0; +https://example.com)"
 
 
-def get_meta_desc(html: str) -> str | None:
-    soup = BeautifulSoup(html, "html.parser")
+# Sentence boundary (used by simple_summary)
+_SENT = re.compile(r"(?<=[.!?])\s+")
+
+# Max number of concurrent website fetches + LLM calls (rows waiting on a domain lock hold no slot)
+MAX_CONCURRENT_ROWS = 16
+
+# Threads for HTML parsing / main text extraction
+PARSE_WORKERS = 8
+
+# LLM results memoized across runs (process lifetime), keyed by _llm_cache_key()
+LLM_CACHE_SIZE = 4096
+_llm_cache: OrderedDict[str, str] = OrderedDict()
+# Shared by all Streamlit session threads
+_llm_cache_lock = threading.Lock()
+
+
+# Compressed responses only; "br" is decoded by the brotli extra of httpx (see requirements.txt).
+# No explicit "Connection: keep-alive": it is the HTTP/1.1 default and is a forbidden header in HTTP/2.
+HEADERS = {
+    "User-Agent": UA,
+    "Accept-Encoding": "gzip, br",
+}
+
+# Keep idle connections around long enough to be reused by further rows of the same domain
+# (typical server-side keepalive timeouts are well above 30s, e.g. nginx defaults to 75s).
+POOL_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=30.0)
+
+
+def _make_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=TIMEOUT_S,
+        headers=HEADERS,
+        follow_redirects=True,
+        http2=True,
+        limits=POOL_LIMITS,
+    )
 
-    og = soup.find("meta", attrs={"property": "og:description"})
-    if og and og.get("content"):
-        t = og["content"].strip()
+
+def parse_html(html: str) -> LexborHTMLParser:
+    """Parse a page once; the tree is shared by the meta and JSON-LD extractors."""
+    return LexborHTMLParser(html)
+
+
+def _meta_desc_in(scope) -> str | None:
+    for sel in ('meta[property="og:description"]', 'meta[name="description"]'):
+        node = scope.css_first(sel)
+        if node is None:
+            continue
+        t = (node.attributes.get("content") or "").strip()
         if t:
             return t
+    return None
+
 
-    md = soup.find("meta", attrs={"name": "description"})
-    if md and md.get("content"):
-        t = md["content"].strip()
+def get_meta_desc(tree: LexborHTMLParser) -> str | None:
+    # og:description / description normally live in <head>, so look there first. The HTML5
+    # parser moves them into <body> when e.g. a <noscript><img> pixel snippet precedes them.
+    if tree.head is not None:
+        t = _meta_desc_in(tree.head)
         if t:
             return t
-
-    return None
+    return _meta_desc_in(tree)
 
 
-def get_jsonld_desc(html: str) -> str | None:
-    soup = BeautifulSoup(html, "html.parser")
-    scripts = soup.find_all("script", attrs={"type": "application/ld+json"})
+def get_jsonld_desc(tree: LexborHTMLParser) -> str | None:
+    scripts = tree.css('script[type="application/ld+json"]')
     for s in scripts:
-        raw = (s.string or "").strip()
-        if not raw:
+        raw = (s.text() or "").strip()
+        # Cheap substring check first: skip e.g. large BreadcrumbList/ItemList blocks without parsing them
+        if not raw or '"description"' not in raw:
             continue
         try:
-            data = json.loads(raw)
-        except Exception:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
             continue
 
         objs = data if isinstance(data, list) else [data]
@@ -94,11 +147,14 @@ def extract_main_text(html: str, url: str) -> str | None:
             url=url,
             include_comments=False,
             include_tables=False,
+            include_formatting=False,
             favor_precision=True,
+            # Precision is all we need here: skip trafilatura's fallback extractors
+            no_fallback=True,
         )
         if not txt:
             return None
-        txt = re.sub(r"\s+", " ", txt).strip()
+        txt = " ".join(txt.split())
         return txt if len(txt) > 200 else None
     except Exception:
         return None
@@ -106,104 +162,359 @@ def extract_main_text(html: str, url: str) -> str | None:
 
 def simple_summary(text: str, max_sentences: int = 2) -> str:
     """Дешёвый fallback, если main_text большой/сырой."""
-    text = re.sub(r"\s+", " ", text).strip()
-    parts = re.split(r"(?<=[.!?])\s+", text)
+    text = " ".join(text.split())
+    parts = _SENT.split(text)
     parts = [p.strip() for p in parts if len(p.strip()) > 30]
     if parts:
         return " ".join(parts[:max_sentences])[:600]
     return text[:300]
 
 
-def enrich_dataframe(df: pd.DataFrame, sheet_name: str = "Database") -> pd.DataFrame:
-    if "Company" not in df.columns or "Website" not in df.columns:
-        raise ValueError("No Company/Website in Database.")
+@dataclass
+class _RunState:
+    """State shared by all rows of one enrich_dataframe_async() run."""
+
+    out: Results
+    client: httpx.AsyncClient
+    sem: asyncio.Semaphore
+    pool: ThreadPoolExecutor
+    # None if the LLM is disabled (no API key)
+    llm: LLMSession | None = None
+    domain_locks: dict[str, asyncio.Lock] = field(default_factory=lambda: defaultdict(asyncio.Lock))
+    last_hit: dict[str, float] = field(default_factory=dict)
+    # domain -> error code of the first failure that is likely to repeat (timeout, 5xx, DNS, ...)
+    domain_fail: dict[str, str] = field(default_factory=dict)
+    # url -> (raw_desc, raw_source), so duplicate websites are scraped only once
+    page_cache: dict[str, tuple[str, str]] = field(default_factory=dict)
+    # Batch mode: rows waiting for the LLM step, as (i, company, url, raw_desc, raw_source)
+    pending: list[tuple] | None = None
+    # LLM calls in progress, so identical inputs running concurrently share one call
+    llm_inflight: dict[str, asyncio.Task] = field(default_factory=dict)
+    # Progress reporting: on_progress(done, total) is called whenever a row finishes
+    on_progress: Callable[[int, int], None] | None = None
+    done: int = 0
+    total: int = 0
+
+
+def _failure_code(e: Exception) -> str | None:
+    """Error code for failures that will most likely repeat for the whole domain, else None."""
+    if isinstance(e, httpx.HTTPStatusError):
+        status = e.response.status_code if e.response is not None else 0
+        return f"error:http:{status}" if status >= 500 else None
+    if isinstance(e, httpx.TimeoutException):
+        return "error:timeout"
+    if isinstance(e, httpx.RequestError):
+        return "error:request"
+    return None
 
-    df = ensure_error_columns(df)
 
-    last_hit: dict[str, float] = {}
-    headers = {"User-Agent": UA}
-
-    with httpx.Client(timeout=TIMEOUT_S, headers=headers, follow_redirects=True) as client:
-        for i, row in df.iterrows():
-            company = safe_str(row.get("Company", ""))
-            url = normalize_url(row.get("Website", ""))
-
-            if not company and not url:
-                mark_skipped(df, i, "Empty row (Company and Website missing)")
-                continue
-            if not url:
-                mark_skipped(df, i, "Website is empty")
-                continue
-
-            domain = domain_of(url)
-
-            prev = last_hit.get(domain)
-            if prev is not None:
-                sleep_for = PER_DOMAIN_DELAY_S - (time.time() - prev)
-                if sleep_for > 0:
-                    time.sleep(sleep_for)
-
-            try:
-                r = client.get(url)
-                r.raise_for_status()
-                html = r.text
-
-                # 1) Build a single "raw" description first (scraper-only baseline)
-                raw_desc = get_meta_desc(html) or get_jsonld_desc(html)
-                raw_source = "meta/jsonld"
-
-                if not raw_desc:
-                    main_txt = extract_main_text(html, url)
-                    if not main_txt:
-                        mark_empty(df, i, "No description found (meta/jsonld/main_text)")
-                        last_hit[domain] = time.time()
-                        continue
-
-                    raw_desc = simple_summary(main_txt[:MAX_TEXT])
-                    raw_source = "main_text"
-
-                # 2) Exactly ONE LLM call to improve the raw description
-                improved = None
+def _extract_raw_desc(html: str, url: str) -> tuple[str, str] | None:
+    tree = parse_html(html)
+    raw_desc = get_meta_desc(tree) or get_jsonld_desc(tree)
+    if raw_desc:
+        return raw_desc, "meta/jsonld"
+
+    main_txt = extract_main_text(html, url)
+    if not main_txt:
+        return None
+    return simple_summary(main_txt[:MAX_TEXT]), "main_text"
+
+
+async def _read_html(r: httpx.Response) -> str:
+    """Reads at most MAX_HTML_BYTES of the body; bigger pages are mostly app bundles anyway."""
+    chunks: list[bytes] = []
+    total = 0
+    async for chunk in r.aiter_bytes():
+        chunks.append(chunk)
+        total += len(chunk)
+        if total >= MAX_HTML_BYTES:
+            break
+    body = b"".join(chunks)[:MAX_HTML_BYTES]
+    return body.decode(r.encoding or "utf-8", errors="replace")
+
+
+async def _scrape(state: _RunState, url: str, domain: str) -> tuple[str, str] | None:
+    """
+    Fetches the page and builds a single "raw" description (scraper-only baseline).
+    Returns (raw_desc, raw_source), or None if no description was found.
+    """
+    prev = state.last_hit.get(domain)
+    if prev is not None:
+        sleep_for = PER_DOMAIN_DELAY_S - (time.time() - prev)
+        if sleep_for > 0:
+            await asyncio.sleep(sleep_for)
+    try:
+        async with state.sem, state.client.stream("GET", url) as r:
+            r.raise_for_status()
+            html = await _read_html(r)
+    finally:
+        state.last_hit[domain] = time.time()
+
+    # Parsing/extraction is CPU-bound: run it in the thread pool, so the event loop keeps
+    # downloading other pages and waiting on LLM calls meanwhile.
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(state.pool, _extract_raw_desc, html, url)
+
+
+def _trim_to_sentence(text: str, n: int) -> str:
+    """Cuts text to at most n chars, ending at the last full sentence if there is one."""
+    if len(text) <= n:
+        return text
+    cut = text[:n]
+    end = max(cut.rfind("."), cut.rfind("!"), cut.rfind("?"))
+    return cut[: end + 1] if end > 0 else cut
+
+
+def _llm_cache_key(company: str, url: str, text: str) -> str:
+    raw = f"{company.lower()}|{domain_of(url)}|{text}"
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _llm_cache_get(key: str) -> str | None:
+    with _llm_cache_lock:
+        improved = _llm_cache.get(key)
+        if improved is not None:
+            _llm_cache.move_to_end(key)
+        return improved
+
+
+def _llm_cache_put(key: str, improved: str | None) -> None:
+    # Only usable results are kept: a disabled/failed LLM should be retried next time
+    if not improved:
+        return
+    with _llm_cache_lock:
+        _llm_cache[key] = improved
+        _llm_cache.move_to_end(key)
+        while len(_llm_cache) > LLM_CACHE_SIZE:
+            _llm_cache.popitem(last=False)
+
+
+async def _rewrite_cached(state: _RunState, company: str, url: str, text: str) -> str | None:
+    key = _llm_cache_key(company, url, text)
+    improved = _llm_cache_get(key)
+    if improved is not None:
+        return improved
+
+    task = state.llm_inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(
+            rewrite_description_async(
+                state.llm,
+                company=company,
+                website=url,
+                extracted_text=text,
+                # Intentionally not passing a "current description" field,
+                # as the underlying website content may change over time.
+                current_description="",
+            )
+        )
+        state.llm_inflight[key] = task
+    try:
+        improved = await task
+    finally:
+        state.llm_inflight.pop(key, None)
+
+    _llm_cache_put(key, improved)
+    return improved
+
+
+def _finish_row(out: Results, i: int, improved: str | None, raw_desc: str, raw_source: str) -> None:
+    # 3) If LLM did not return a usable result, keep the scraper-only description
+    improved = (improved or "").strip()
+    if improved and len(improved) >= 30:
+        mark_success(out, i, improved, raw_source)
+    else:
+        mark_success(out, i, raw_desc, f"{raw_source}+llm_fallback")
+
+
+async def _process_row(state: _RunState, i: int, company: str, url: str | None) -> None:
+    """
+    Scrapes one row and improves its description with the LLM.
+    In batch mode (state.pending is set) the LLM step is deferred: the row is queued instead.
+    """
+    out = state.out
+
+    if not company and not url:
+        mark_skipped(out, i, "Empty row (Company and Website missing)")
+        return
+    if not url:
+        mark_skipped(out, i, "Website is empty")
+        return
+
+    domain = domain_of(url)
+
+    try:
+        # 1) Per-domain politeness: requests to the same host are serialized and spaced out,
+        # while different hosts are fetched concurrently. The row semaphore is only taken for the
+        # fetch itself, so rows queued on a busy domain don't hold slots other domains could use.
+        async with state.domain_locks[domain]:
+            # An already scraped URL is reused even if its domain failed later on
+            scraped = state.page_cache.get(url)
+            if scraped is None:
+                failed = state.domain_fail.get(domain)
+                if failed:
+                    mark_error(out, i, "error:cached_failure", f"Skipped {url}: earlier request to {domain} failed ({failed})")
+                    return
+
                 try:
-                    improved = rewrite_description(
-                        company=company,
-                        website=url,
-                        extracted_text=raw_desc[:LLM_CONTEXT_CHARS],
-                         # Intentionally not passing a "current description" field,
-                        # as the underlying website content may change over time.
-                        current_description="",  
-                    )
-                    improved = (improved or "").strip()
+                    scraped = await _scrape(state, url, domain)
                 except Exception as e:
-                    # Log any LLM issues but keep the pipeline running (fallback to scraper output)
-                    print(
-                        "[LLM ERROR]",
-                        f"company={company}",
-                        f"url={url}",
-                        f"type={type(e).__name__}",
-                        f"message={e}",
-                    )
-                    improved = None
-
-                # 3) If LLM did not return a usable result, keep the scraper-only description
-                if improved and len(improved) >= 30:
-                    mark_success(df, i, improved, raw_source)
-                else:
-                    mark_success(df, i, raw_desc, f"{raw_source}+llm_fallback")
-
-            except httpx.HTTPStatusError as e:
-                status = e.response.status_code if e.response is not None else "NA"
-                mark_error(df, i, f"error:http:{status}", f"HTTP {status} for {url}")
-            except httpx.TimeoutException:
-                mark_error(df, i, "error:timeout", f"Timeout for {url}")
-            except httpx.RequestError as e:
-                mark_error(df, i, "error:request", f"Request error: {type(e).__name__} ({e}) for {url}")
-            except Exception as e:
-                mark_error(df, i, f"error:{type(e).__name__}", f"{type(e).__name__}: {e}")
-
-            last_hit[domain] = time.time()
-
-    return df
+                    code = _failure_code(e)
+                    if code:
+                        state.domain_fail[domain] = code
+                    raise
+                if scraped is not None:
+                    state.page_cache[url] = scraped
+
+        if scraped is None:
+            mark_empty(out, i, "No description found (meta/jsonld/main_text)")
+            return
+        raw_desc, raw_source = scraped
+
+        if state.pending is not None:
+            state.pending.append((i, company, url, raw_desc, raw_source))
+            return
+
+        # 2) Exactly ONE LLM call to improve the raw description
+        improved = None
+        try:
+            async with state.sem:
+                improved = await _rewrite_cached(state, company, url, _trim_to_sentence(raw_desc, LLM_CONTEXT_CHARS))
+        except Exception as e:
+            # Log any LLM issues but keep the pipeline running (fallback to scraper output)
+            logger.warning(
+                "LLM error company=%s url=%s type=%s message=%s", company, url, type(e).__name__, e
+            )
+            improved = None
+
+        _finish_row(out, i, improved, raw_desc, raw_source)
+
+    except httpx.HTTPStatusError as e:
+        status = e.response.status_code if e.response is not None else "NA"
+        mark_error(out, i, f"error:http:{status}", f"HTTP {status} for {url}")
+    except httpx.TimeoutException:
+        mark_error(out, i, "error:timeout", f"Timeout for {url}")
+    except httpx.RequestError as e:
+        mark_error(out, i, "error:request", f"Request error: {type(e).__name__} ({e}) for {url}")
+    except Exception as e:
+        mark_error(out, i, f"error:{type(e).__name__}", f"{type(e).__name__}: {e}")
+
+
+async def _run_row(state: _RunState, i: int, company: str, url: str | None) -> None:
+    try:
+        await _process_row(state, i, company, url)
+    finally:
+        # All rows run on the same event loop thread, so no lock is needed around the counter
+        state.done += 1
+        if state.on_progress is not None:
+            state.on_progress(state.done, state.total)
+
+
+async def _rewrite_batch(
+    pending: list[tuple],
+    on_batch_submitted: Callable[[str, int], None] | None = None,
+) -> dict[int, str | None]:
+    """
+    Runs the deferred LLM step of all queued rows as one OpenAI batch.
+    Cached and duplicate inputs are sent only once. Returns {row position: improved description}.
+    on_batch_submitted(batch_id, n_requests) is called before waiting for the batch (up to 24h).
+    """
+    keys: dict[int, str] = {}
+    improved_by_key: dict[str, str | None] = {}
+    rows: list[dict] = []
+    for i, company, url, raw_desc, _ in pending:
+        text = _trim_to_sentence(raw_desc, LLM_CONTEXT_CHARS)
+        key = keys[i] = _llm_cache_key(company, url, text)
+        if key in improved_by_key:
+            continue
+        improved_by_key[key] = _llm_cache_get(key)
+        if improved_by_key[key] is None:
+            rows.append({"custom_id": key, "company": company, "website": url, "extracted_text": text})
+
+    if rows:
+        try:
+            batch_id = await asyncio.to_thread(submit_batch, rows)
+            results = {}
+            if batch_id:
+                logger.info("LLM batch submitted id=%s requests=%d", batch_id, len(rows))
+                if on_batch_submitted is not None:
+                    on_batch_submitted(batch_id, len(rows))
+                results = await asyncio.to_thread(wait_for_batch, batch_id)
+        except Exception as e:
+            # Same policy as for single calls: fall back to scraper output for the whole batch
+            logger.warning("LLM batch error rows=%d type=%s message=%s", len(rows), type(e).__name__, e)
+            results = {}
+        for key, improved in results.items():
+            improved_by_key[key] = improved
+            _llm_cache_put(key, improved)
+
+    return {i: improved_by_key.get(key) for i, key in keys.items()}
+
+
+async def enrich_dataframe_async(
+    df: pd.DataFrame,
+    sheet_name: str = "Database",
+    use_batch_api: bool = False,
+    on_progress: Callable[[int, int], None] | None = None,
+    on_batch_submitted: Callable[[str, int], None] | None = None,
+) -> pd.DataFrame:
+    """
+    Enriches the Description column of `df`.
+    With use_batch_api=True all rows are scraped first (pass 1) and the LLM rewrites are sent
+    as one OpenAI Batch API job afterwards (pass 2): cheaper, but may take up to 24h.
+    on_progress(done, total) is called each time a row finishes (in batch mode: its scrape).
+    on_batch_submitted(batch_id, n_requests) is called in batch mode once pass 2 starts waiting.
+    """
+    if "Company" not in df.columns or "Website" not in df.columns:
+        raise ValueError("No Company/Website in Database.")
+
+    df = ensure_error_columns(df)
+    out = init_results(df)
+
+    # Normalize inputs once up front, so the per-row code works on plain str values
+    companies = [safe_str(v) for v in df["Company"].to_numpy()]
+    urls = [normalize_url(v) for v in df["Website"].to_numpy()]
+    logger.info("Enrichment started rows=%d batch_api=%s", len(df), use_batch_api)
+
+    # The HTTP client and LLM session are bound to the running event loop, so they are created
+    # per run (Streamlit calls asyncio.run() on every button press, in per-session threads).
+    with ThreadPoolExecutor(max_workers=PARSE_WORKERS) as pool:
+        async with _make_client() as client, llm_session() as llm:
+            state = _RunState(
+                out=out,
+                client=client,
+                sem=asyncio.Semaphore(MAX_CONCURRENT_ROWS),
+                pool=pool,
+                llm=llm,
+                pending=[] if use_batch_api else None,
+                on_progress=on_progress,
+                total=len(df),
+            )
+            results = await asyncio.gather(
+                *(
+                    _run_row(state, i, company, url)
+                    for i, (company, url) in enumerate(zip(companies, urls))
+                ),
+                return_exceptions=True,
+            )
+
+    # Failures inside a row are recorded via mark_error(); anything escaping _process_row is a bug
+    for i, res in enumerate(results):
+        if isinstance(res, BaseException):
+            logger.error("Row %d failed: %s: %s", i, type(res).__name__, res, exc_info=res)
+
+    if state.pending:
+        improved_by_row = await _rewrite_batch(state.pending, on_batch_submitted)
+        for i, _, _, raw_desc, raw_source in state.pending:
+            _finish_row(out, i, improved_by_row.get(i), raw_desc, raw_source)
+
+    logger.info("Enrichment finished rows=%d", len(df))
+    return apply_results(df, out)
+
+
+def enrich_dataframe(df: pd.DataFrame, sheet_name: str = "Database", use_batch_api: bool = False) -> pd.DataFrame:
+    """Synchronous wrapper around enrich_dataframe_async()."""
+    return asyncio.run(enrich_dataframe_async(df, sheet_name, use_batch_api))
 
 
 # ---------------------------------------------------------------------
@@ -212,6 +523,13 @@ def enrich_dataframe(df: pd.DataFrame, sheet_name: str = "Database") -> pd.DataF
 # Configure the following environment variables in your deployment platform:
 #   - OPENAI_API_KEY : API key used by llm_openai.py to call the LLM
 #   - OPENAI_MODEL   : optional override for the model name (e.g., gpt-5-mini)
+#   - OPENAI_BASE_URL, OPENAI_ORG_ID, OPENAI_PROJECT_ID : optional, as for the OpenAI SDK
+#                                      (e.g. a proxy/gateway); used by all LLM paths
+#   - OPENAI_RPM, OPENAI_CONCURRENCY : optional client-side rate limit (requests/min)
+#                                      and max in-flight LLM calls per run (defaults: 500, 32)
+#   - OPENAI_MAX_OUTPUT_TOKENS, OPENAI_REASONING_EFFORT : optional output cap (default 120)
+#                                      and reasoning effort (default: "minimal" for gpt-5*,
+#                                      "low" for o-series, not sent for other models)
 #
 # The application is designed to be resilient:
 #   - The scraper runs first and produces a baseline description.
@@ -17,6 +17,9 @@ def now_utc_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 def safe_str(v) -> str:
+    # Fast path for the common case, skips the pd.isna() type dispatch
+    if type(v) is str:
+        return v.strip()
     if v is None or (isinstance(v, float) and pd.isna(v)) or pd.isna(v):
         return ""
     return str(v).strip()
@@ -35,26 +38,39 @@ def domain_of(url: str) -> str:
     except Exception:
         return ""
 
-def mark_skipped(df: pd.DataFrame, i: int, reason: str) -> None:
-    df.at[i, "UI_status"] = "skipped"
-    df.at[i, "Error"] = reason
-    df.at[i, "Last_checked"] = now_utc_iso()
+# Per-row results are buffered in plain lists (one per column, indexed by row position)
+# and written back to the DataFrame in one go: scalar `df.at[...] = ...` writes are slow.
+Results = dict[str, list]
 
-def mark_success(df: pd.DataFrame, i: int, desc: str, ui_status: str) -> None:
-    df.at[i, "Description"] = desc
-    df.at[i, "UI_status"] = ui_status
-    df.at[i, "Error"] = pd.NA
-    df.at[i, "Last_checked"] = now_utc_iso()
+def init_results(df: pd.DataFrame, cols=DEFAULT_COLS) -> Results:
+    # Start from the current values, so columns a marker does not touch are kept as-is
+    return {c: df[c].tolist() for c in cols}
 
-def mark_empty(df: pd.DataFrame, i: int, reason: str = "No description found") -> None:
-    df.at[i, "UI_status"] = "empty"
-    df.at[i, "Error"] = reason
-    df.at[i, "Last_checked"] = now_utc_iso()
+def apply_results(df: pd.DataFrame, out: Results) -> pd.DataFrame:
+    for c, values in out.items():
+        df[c] = values
+    return df
+
+def mark_skipped(out: Results, i: int, reason: str) -> None:
+    out["UI_status"][i] = "skipped"
+    out["Error"][i] = reason
+    out["Last_checked"][i] = now_utc_iso()
+
+def mark_success(out: Results, i: int, desc: str, ui_status: str) -> None:
+    out["Description"][i] = desc
+    out["UI_status"][i] = ui_status
+    out["Error"][i] = pd.NA
+    out["Last_checked"][i] = now_utc_iso()
+
+def mark_empty(out: Results, i: int, reason: str = "No description found") -> None:
+    out["UI_status"][i] = "empty"
+    out["Error"][i] = reason
+    out["Last_checked"][i] = now_utc_iso()
 
-def mark_error(df: pd.DataFrame, i: int, code: str, message: str) -> None:
-    df.at[i, "UI_status"] = code
-    df.at[i, "Error"] = message
-    df.at[i, "Last_checked"] = now_utc_iso()
+def mark_error(out: Results, i: int, code: str, message: str) -> None:
+    out["UI_status"][i] = code
+    out["Error"][i] = message
+    out["Last_checked"][i] = now_utc_iso()
 
 def extract_errors_table(df: pd.DataFrame) -> pd.DataFrame:
     if "Error" not in df.columns:
@@ -1,5 +1,18 @@
+import asyncio
+import io
+import json
+import logging
 import os
+import re
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator
+
+import aiohttp
+from aiolimiter import AsyncLimiter
 from openai import OpenAI
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 
 
 # strict schema: {"description": "..."}.
@@ -26,8 +39,46 @@ SYSTEM = (
     "- If information is insufficient, write a cautious minimal description.\n"
 )
 
+_PROMPT_TMPL = "Company: {c}\nWebsite: {w}\n{cur}\nWebsite/extracted text:\n{t}\n"
+
+# Built once and shared by every request (read-only)
+_MODEL = os.environ.get("OPENAI_MODEL", "gpt-5-mini")
+# Responses API shape: name/schema/strict sit directly under text.format
+# (unlike Chat Completions, which nests them under "json_schema")
+_TEXT_ARG = {"format": {"type": "json_schema", **SCHEMA}}
+
+# Enough for 50 words + JSON boilerplate. Reasoning models (like the default gpt-5-mini) count
+# their reasoning tokens against this limit as well, so reasoning effort is kept minimal.
+MAX_OUTPUT_TOKENS = int(os.environ.get("OPENAI_MAX_OUTPUT_TOKENS", "120"))
+
+
+def _default_reasoning_effort(model: str) -> str:
+    """Lowest effort the model family accepts; "" (no reasoning param) for non-reasoning models."""
+    m = model.lower()
+    if m.startswith("gpt-5") and "chat" not in m:
+        return "minimal"
+    if re.match(r"o\d", m):
+        return "low"
+    return ""
+
+
+# Non-reasoning models (e.g. gpt-4o-mini) reject the reasoning param, so it is only sent for
+# reasoning-capable ones unless OPENAI_REASONING_EFFORT is set explicitly
+_REASONING_EFFORT = os.environ.get("OPENAI_REASONING_EFFORT", _default_reasoning_effort(_MODEL))
+
+logger = logging.getLogger(__name__)
+
 _client: OpenAI | None = None
 
+# Client-side guards against 429s under async fan-out: requests per minute and max in-flight calls
+# (per run, see llm_session())
+OPENAI_RPM = int(os.environ.get("OPENAI_RPM", "500"))
+OPENAI_CONCURRENCY = int(os.environ.get("OPENAI_CONCURRENCY", "32"))
+
+# /v1/responses is called directly (instead of through AsyncOpenAI/httpx.AsyncClient), which
+# scales better under high concurrency. Same env settings as the SDK used by the sync/batch paths.
+DEFAULT_BASE_URL = "https://api.openai.com/v1"
+
 
 def _get_client() -> OpenAI | None:
     """Lazy init. Returns None if OPENAI_API_KEY is not set."""
@@ -42,6 +93,108 @@ def _get_client() -> OpenAI | None:
     _client = OpenAI(api_key=api_key)
     return _client
 
+@dataclass
+class LLMSession:
+    """Everything rewrite_description_async() needs; all of it is bound to one event loop / run."""
+
+    http: aiohttp.ClientSession
+    responses_url: str
+    limiter: AsyncLimiter
+    in_flight: asyncio.Semaphore
+
+
+def _auth_headers(api_key: str) -> dict[str, str]:
+    # Mirrors the SDK: organization/project come from the same env vars
+    headers = {"Authorization": f"Bearer {api_key}"}
+    if os.environ.get("OPENAI_ORG_ID"):
+        headers["OpenAI-Organization"] = os.environ["OPENAI_ORG_ID"]
+    if os.environ.get("OPENAI_PROJECT_ID"):
+        headers["OpenAI-Project"] = os.environ["OPENAI_PROJECT_ID"]
+    return headers
+
+
+@asynccontextmanager
+async def llm_session() -> AsyncIterator[LLMSession | None]:
+    """
+    Opens the aiohttp session, rate limiter and in-flight semaphore for one run.
+    Yields None if OPENAI_API_KEY is not set. Created per run (not per process): Streamlit runs
+    every user session in its own thread with its own event loop.
+    """
+    api_key = os.environ.get("OPENAI_API_KEY")
+    if not api_key:
+        yield None
+        return
+
+    async with aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300),
+        timeout=aiohttp.ClientTimeout(total=60),
+        headers=_auth_headers(api_key),
+    ) as http:
+        yield LLMSession(
+            http=http,
+            responses_url=(os.environ.get("OPENAI_BASE_URL") or DEFAULT_BASE_URL).rstrip("/") + "/responses",
+            limiter=AsyncLimiter(OPENAI_RPM, 60),
+            in_flight=asyncio.Semaphore(OPENAI_CONCURRENCY),
+        )
+
+
+def _build_input(company: str, website: str, extracted_text: str, current_description: str = "") -> list[dict]:
+    # The "Current description" line is only sent when there is one (saves tokens otherwise)
+    current = f"Current description: {current_description}\n" if current_description else ""
+    prompt = _PROMPT_TMPL.format(c=company, w=website, cur=current, t=extracted_text)
+    return [
+        {"role": "system", "content": SYSTEM},
+        {"role": "user", "content": prompt},
+    ]
+
+
+def _request_body(company: str, website: str, extracted_text: str, current_description: str = "") -> dict:
+    # Responses API + Structured Outputs
+    body = {
+        "model": _MODEL,
+        "input": _build_input(company, website, extracted_text, current_description),
+        "max_output_tokens": MAX_OUTPUT_TOKENS,
+        "text": _TEXT_ARG,
+    }
+    if _REASONING_EFFORT:
+        body["reasoning"] = {"effort": _REASONING_EFFORT}
+    return body
+
+
+def _clean_description(desc) -> str | None:
+    desc = (desc or "").strip()
+    # safety fallback
+    return desc[:600] if desc else None
+
+
+def _parse_description(resp) -> str | None:
+    # output_parsed only exists on some SDK versions / responses.parse(), and is not always a dict
+    data = getattr(resp, "output_parsed", None)
+    if isinstance(data, dict):
+        return _clean_description(data.get("description"))
+    # Otherwise read the JSON text of the message (the first output item may be a reasoning item)
+    return _parse_description_json(resp.model_dump())
+
+
+def _parse_description_json(body: dict) -> str | None:
+    """Same as _parse_description(), but for a raw Responses API JSON body (e.g. from a batch output file)."""
+    if body.get("status") == "incomplete":
+        # Typically max_output_tokens was hit before the message was complete
+        logger.warning("LLM response incomplete id=%s details=%s", body.get("id"), body.get("incomplete_details"))
+        return None
+    for item in body.get("output") or []:
+        if item.get("type") != "message":
+            continue
+        for part in item.get("content") or []:
+            if part.get("type") == "output_text" and part.get("text"):
+                try:
+                    data = json.loads(part["text"])
+                except ValueError:
+                    return None
+                return _clean_description(data.get("description")) if isinstance(data, dict) else None
+    return None
+
+
 def rewrite_description(company: str, website: str, extracted_text: str, current_description: str = "") -> str | None:
     """
     Returns improved description (string) or None if LLM is disabled/unavailable.
@@ -50,31 +203,117 @@ def rewrite_description(company: str, website: str, extracted_text: str, current
     if client is None:
         # LLM disabled (no API key) -> let caller fall back to scraper result
         return None
-    
-    prompt = f"""Company: {company}
-Website: {website}
-Current description: {current_description or "EMPTY"}
 
-Website/extracted text:
-{extracted_text}
-"""
+    resp = client.responses.create(**_request_body(company, website, extracted_text, current_description))
+    return _parse_description(resp)
 
-    # Responses API + Structured Outputs
-    resp = client.responses.create(
-        model=os.environ.get("OPENAI_MODEL", "gpt-5-mini"),
-        input=[
-            {"role": "system", "content": SYSTEM},
-            {"role": "user", "content": prompt},
-        ],
-        text={
-            "format": {
-                "type": "json_schema",
-                "json_schema": SCHEMA
-            }
+
+def _is_retryable(e: BaseException) -> bool:
+    if isinstance(e, aiohttp.ClientResponseError):
+        return e.status == 429 or e.status >= 500
+    return isinstance(e, (asyncio.TimeoutError, aiohttp.ClientConnectionError))
+
+
+@retry(
+    wait=wait_exponential_jitter(initial=1, max=30),
+    stop=stop_after_attempt(5),
+    retry=retry_if_exception(_is_retryable),
+    reraise=True,
+)
+async def _post_responses(llm: LLMSession, body: dict) -> dict:
+    # Every attempt (including retries) goes through the rate limiter and the in-flight cap
+    async with llm.limiter, llm.in_flight:
+        async with llm.http.post(llm.responses_url, json=body) as resp:
+            if resp.status >= 400:
+                # Keep the API's error body: raise_for_status() alone only says e.g. "Bad Request"
+                detail = (await resp.text())[:1000]
+                raise aiohttp.ClientResponseError(
+                    resp.request_info,
+                    resp.history,
+                    status=resp.status,
+                    message=f"{resp.reason}: {detail}",
+                    headers=resp.headers,
+                )
+            return await resp.json()
+
+
+async def rewrite_description_async(
+    llm: LLMSession | None, company: str, website: str, extracted_text: str, current_description: str = ""
+) -> str | None:
+    """
+    Async variant of rewrite_description() for the concurrent pipeline.
+    `llm` comes from llm_session(); None means LLM disabled.
+    """
+    if llm is None:
+        return None
+
+    body = _request_body(company, website, extracted_text, current_description)
+    data = await _post_responses(llm, body)
+    return _parse_description_json(data)
+
+
+# ---------------------------------------------------------------------
+# Batch API (bulk, non-interactive runs: ~50% cheaper, results within 24h)
+# ---------------------------------------------------------------------
+
+BATCH_FINAL_STATES = {"completed", "failed", "expired", "cancelled"}
+
+
+def submit_batch(rows: list[dict]) -> str | None:
+    """
+    Uploads one /v1/responses request per row and starts a batch.
+    Each row needs: custom_id, company, website, extracted_text.
+    Returns the batch id, or None if LLM is disabled (no API key).
+    """
+    client = _get_client()
+    if client is None:
+        return None
+
+    buf = io.BytesIO()
+    for row in rows:
+        line = {
+            "custom_id": row["custom_id"],
+            "method": "POST",
+            "url": "/v1/responses",
+            "body": _request_body(row["company"], row["website"], row["extracted_text"]),
         }
+        buf.write(json.dumps(line, ensure_ascii=False).encode("utf-8"))
+        buf.write(b"\n")
+    buf.seek(0)
+
+    batch_file = client.files.create(file=("batch_input.jsonl", buf), purpose="batch")
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/responses",
+        completion_window="24h",
     )
+    return batch.id
 
-    data = resp.output_parsed or {}  # thanks to strict schema this is parsed JSON
-    desc = (data.get("description") or "").strip()
-    # safety fallback
-    return desc[:600] if desc else None
+
+def wait_for_batch(batch_id: str, poll: float = 10) -> dict[str, str | None]:
+    """
+    Polls the batch until it reaches a final state and returns {custom_id: description}.
+    Rows that failed inside the batch map to None.
+    """
+    client = _get_client()
+    if client is None:
+        return {}
+
+    batch = client.batches.retrieve(batch_id)
+    while batch.status not in BATCH_FINAL_STATES:
+        time.sleep(poll)
+        batch = client.batches.retrieve(batch_id)
+
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(f"Batch {batch_id} finished with status {batch.status}")
+
+    results: dict[str, str | None] = {}
+    content = client.files.content(batch.output_file_id)
+    for line in content.text.splitlines():
+        if not line.strip():
+            continue
+        obj = json.loads(line)
+        response = obj.get("response") or {}
+        body = response.get("body") if response.get("status_code") == 200 else None
+        results[obj["custom_id"]] = _parse_description_json(body) if body else None
+    return results
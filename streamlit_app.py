@@ -1,11 +1,18 @@
+import asyncio
 import io
+import logging
 import streamlit as st
 import pandas as pd
 
 from dotenv import load_dotenv
 load_dotenv()
 
-from enricher import enrich_dataframe
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+# httpx/httpcore log every request at INFO; keep per-page fetches out of the progress logs
+for noisy in ("httpx", "httpcore"):
+    logging.getLogger(noisy).setLevel(logging.WARNING)
+
+from enricher import enrich_dataframe_async
 from error_logging import extract_errors_table
 
 
@@ -26,16 +33,43 @@ uploaded_file = st.file_uploader("Upload Excel (.xlsx)", type=["xlsx", "xlsm"])
 
 if uploaded_file:
     try:
-        df = pd.read_excel(uploaded_file, sheet_name="Database")
+        df = pd.read_excel(uploaded_file, sheet_name="Database", engine="calamine")
         st.success(f"File uploaded successfully. Rows found: {len(df)}")
         st.dataframe(df.head(5))
     except Exception:
         st.error("Failed to read the Database sheet")
         st.stop()
 
+    use_batch_api = st.checkbox(
+        "Use OpenAI Batch API (about 50% cheaper, but results may take up to 24h)",
+        value=False,
+    )
+
     if st.button("🚀 Generate descriptions"):
-        with st.spinner("Processing websites..."):
-            df_out = enrich_dataframe(df)
+        progress = st.progress(0.0, text="Processing websites...")
+
+        batch_status = []
+
+        def on_progress(done: int, total: int) -> None:
+            progress.progress(done / total, text=f"Processing websites... {done}/{total}")
+
+        def on_batch_submitted(batch_id: str, n_requests: int) -> None:
+            progress.empty()
+            status = st.status(f"Waiting for OpenAI batch {batch_id}...", state="running")
+            status.write(f"{n_requests} LLM requests submitted. This can take up to 24h; keep this page open.")
+            batch_status.append(status)
+
+        df_out = asyncio.run(
+            enrich_dataframe_async(
+                df,
+                use_batch_api=use_batch_api,
+                on_progress=on_progress,
+                on_batch_submitted=on_batch_submitted,
+            )
+        )
+        progress.empty()
+        for status in batch_status:
+            status.update(label="OpenAI batch finished", state="complete")
 
         # --- UI: show technical details ---
         err_df = extract_errors_table(df_out)
@@ -62,7 +96,7 @@ if uploaded_file:
         df_excel = df_out[excel_cols].copy()
 
         output = io.BytesIO()
-        with pd.ExcelWriter(output, engine="openpyxl") as writer:
+        with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
             df_excel.to_excel(writer, sheet_name="Database", index=False)
         output.seek(0)
 